@@ -15,18 +15,43 @@ __version__ = "0.1.0"
 __author__ = "Ask Gloom"
 __license__ = "MIT"
 
-from .core.browser import Browser
-from .core.profile import Profile
-from .exceptions.core_exceptions import (
-    BrowserException,
-    ProfileException,
-    ConfigurationException
-)
+import importlib
+from typing import Any, List
+
+# Public names are resolved on first access (PEP 562) so that importing the
+# package does not pull in selenium and webdriver_manager up front.
+_LAZY = {
+    "Browser": ("askgloom.core.browser", "Browser"),
+    "BrowserPool": ("askgloom.core.pool", "BrowserPool"),
+    "Profile": ("askgloom.core.profile", "Profile"),
+    "BrowserException": ("askgloom.exceptions.core_exceptions", "BrowserException"),
+    "ProfileException": ("askgloom.exceptions.core_exceptions", "ProfileException"),
+    "ConfigurationException": (
+        "askgloom.exceptions.core_exceptions",
+        "ConfigurationException",
+    ),
+}
 
 __all__ = [
     "Browser",
+    "BrowserPool",
     "Profile",
     "BrowserException",
     "ProfileException",
     "ConfigurationException",
-]
\ No newline at end of file
+]
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes lazily on first access."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    """List module attributes including lazily loaded ones."""
+    return sorted(list(globals()) + list(_LAZY))
@@ -3,17 +3,70 @@ Core browser automation functionality for Ask Gloom.
 Provides a high-level interface for browser control and automation.
 """
 
+import os
 import logging
-from typing import Optional, Dict, Any
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
-from ..exceptions.core_exceptions import BrowserException
-from .profile import Profile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
+from ..exceptions.core_exceptions import BrowserException, ConfigurationException
+from .profile import Profile, Config
+
+if TYPE_CHECKING:
+    from .pool import BrowserPool
 
 logger = logging.getLogger(__name__)
 
+# Resolved ChromeDriver binary, shared by all Browser instances in the process
+_DRIVER_PATH: Optional[str] = None
+_DRIVER_LOCK = threading.Lock()
+
+def _resolve_driver_path(stale: Optional[str] = None) -> str:
+    """
+    Resolve the ChromeDriver binary path, reusing earlier results.
+
+    The path is memoized for the process and persisted to the configuration
+    under "browser.driver_path". Set ASKGLOOM_REFRESH_DRIVER to ignore the
+    persisted path and have webdriver_manager resolve the driver again.
+    Reading or saving the configuration is best-effort and never fails
+    resolution.
+
+    Args:
+        stale (str, optional): Path that failed to start Chrome; if it is
+            still the current one, the driver is resolved again
+
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    global _DRIVER_PATH
+
+    with _DRIVER_LOCK:
+        if _DRIVER_PATH is not None and _DRIVER_PATH != stale:
+            return _DRIVER_PATH
+
+        config: Optional[Config] = None
+        cached = None
+        try:
+            config = Config.get_instance()
+            cached = config.get("browser.driver_path")
+        except (ConfigurationException, OSError) as e:
+            logger.warning(f"Could not read saved ChromeDriver path: {str(e)}")
+
+        refresh = stale is not None or bool(os.getenv("ASKGLOOM_REFRESH_DRIVER"))
+        if cached and not refresh and os.path.isfile(cached):
+            _DRIVER_PATH = cached
+            return _DRIVER_PATH
+
+        from webdriver_manager.chrome import ChromeDriverManager
+
+        _DRIVER_PATH = ChromeDriverManager().install()
+        logger.debug(f"Resolved ChromeDriver at {_DRIVER_PATH}")
+        if config is not None and _DRIVER_PATH != cached:
+            try:
+                config.set("browser.driver_path", _DRIVER_PATH)
+            except (ConfigurationException, OSError) as e:
+                logger.warning(f"Could not save ChromeDriver path: {str(e)}")
+        return _DRIVER_PATH
+
 class Browser:
     """
     Main browser automation class that handles browser initialization,
@@ -24,7 +77,8 @@ class Browser:
         self,
         profile: Optional[Profile] = None,
         headless: bool = False,
-        options: Optional[Dict[str, Any]] = None
+        options: Optional[Dict[str, Any]] = None,
+        pool: Optional["BrowserPool"] = None
     ):
         """
         Initialize browser instance.
@@ -33,15 +87,25 @@ class Browser:
             profile (Profile, optional): Browser profile to use
             headless (bool): Whether to run in headless mode
             options (Dict[str, Any], optional): Additional browser options
+            pool (BrowserPool, optional): Pool to check a browser out of when
+                used as a context manager, instead of launching a new one
         """
         self.profile = profile or Profile()
         self.headless = headless
         self.options = options or {}
         self.driver = None
-        self._initialize_browser()
+        self.pool = pool
+        self._pooled: Optional["Browser"] = None
+        if self.pool is None:
+            self._initialize_browser()
 
     def _initialize_browser(self) -> None:
         """Set up and initialize the browser instance."""
+        # Deferred so that importing this module does not load selenium
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+
         try:
             chrome_options = Options()
             
@@ -61,8 +125,21 @@ class Browser:
                     chrome_options.add_argument(f"--{option}={value}")
 
             # Initialize ChromeDriver
-            service = Service(ChromeDriverManager().install())
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            driver_path = _resolve_driver_path()
+            try:
+                self.driver = webdriver.Chrome(
+                    service=Service(driver_path), options=chrome_options
+                )
+            except Exception as e:
+                # A driver saved by an earlier run stops matching Chrome after
+                # a browser update; resolve it again once
+                fresh_path = _resolve_driver_path(stale=driver_path)
+                if fresh_path == driver_path:
+                    raise
+                logger.warning(f"ChromeDriver at {driver_path} failed, retrying: {str(e)}")
+                self.driver = webdriver.Chrome(
+                    service=Service(fresh_path), options=chrome_options
+                )
             
             logger.info("Browser initialized successfully")
         
@@ -84,6 +161,59 @@ class Browser:
             logger.error(f"Navigation failed: {str(e)}")
             raise BrowserException(f"Failed to navigate to {url}: {str(e)}")
 
+    @classmethod
+    def navigate_many(
+        cls,
+        urls: List[str],
+        max_workers: int = 4,
+        pool: Optional["BrowserPool"] = None,
+        **browser_kwargs: Any
+    ) -> List[str]:
+        """
+        Navigate to several URLs concurrently using pooled browsers.
+
+        Args:
+            urls (List[str]): URLs to navigate to
+            max_workers (int): Maximum number of concurrent navigations
+            pool (BrowserPool, optional): Existing pool to draw browsers from,
+                a temporary pool is created and closed if not provided
+            **browser_kwargs: Arguments for browsers in the temporary pool; a
+                profile with a path limits it to a single worker
+
+        Returns:
+            List[str]: Resulting URL of each navigation, in input order
+        """
+        if not urls:
+            return []
+
+        from .pool import BrowserPool
+
+        owns_pool = pool is None
+        if owns_pool:
+            size = min(max_workers, len(urls))
+            if getattr(browser_kwargs.get("profile"), "path", None):
+                # Chrome cannot share a user data directory between instances
+                size = 1
+            pool = BrowserPool(size=size, **browser_kwargs)
+
+        def visit(url: str) -> str:
+            browser = pool.acquire()
+            try:
+                browser.navigate(url)
+                result = browser.current_url()
+            except Exception:
+                pool.release(browser, broken=True)
+                raise
+            pool.release(browser)
+            return result
+
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(visit, urls))
+        finally:
+            if owns_pool:
+                pool.close()
+
     def current_url(self) -> str:
         """Get current URL."""
         return self.driver.current_url
@@ -116,8 +246,16 @@ class Browser:
 
     def __enter__(self):
         """Context manager entry."""
+        if self.pool is not None:
+            self._pooled = self.pool.acquire()
+            self.driver = self._pooled.driver
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit."""
-        self.quit()
+        if self._pooled is not None:
+            self.pool.release(self._pooled, broken=exc_type is not None)
+            self._pooled = None
+            self.driver = None
+        else:
+            self.quit()
@@ -0,0 +1,195 @@
+"""
+Browser pooling for Ask Gloom.
+Keeps a set of pre-warmed browser instances that can be checked out and
+returned, amortizing the browser startup cost across many short tasks.
+"""
+
+import logging
+import queue
+import threading
+from typing import Optional, Dict, Any
+from ..exceptions.core_exceptions import BrowserException
+from .browser import Browser
+from .profile import Config
+
+logger = logging.getLogger(__name__)
+
+class BrowserPool:
+    """
+    Pool of reusable browser instances.
+
+    Browsers are created up front and handed out via acquire()/release().
+    Each instance is reset between uses and fully recreated once it has
+    served max_uses checkouts or has been released as broken. If recreating
+    a browser fails, its slot is kept and the browser is created again on
+    the next acquire().
+    """
+
+    def __init__(
+        self,
+        size: Optional[int] = None,
+        max_uses: Optional[int] = None,
+        timeout: Optional[float] = None,
+        config: Optional[Config] = None,
+        **browser_kwargs: Any
+    ):
+        """
+        Initialize browser pool.
+
+        Args:
+            size (int, optional): Number of browsers to keep warm
+                (defaults to the "pool.size" configuration value)
+            max_uses (int, optional): Checkouts before a browser is recreated
+                (defaults to the "pool.max_uses" configuration value)
+            timeout (float, optional): Seconds acquire() waits for a free browser,
+                None to wait indefinitely
+            config (Config, optional): Configuration to read defaults from
+            **browser_kwargs: Arguments passed to each Browser instance; a
+                profile with a path is only allowed for a pool of size 1, as
+                Chrome cannot run two instances on one user data directory
+        """
+        if size is None or max_uses is None:
+            config = config or Config.get_instance()
+            if size is None:
+                size = config.get("pool.size", 4)
+            if max_uses is None:
+                max_uses = config.get("pool.max_uses", 50)
+
+        if size < 1:
+            raise BrowserException(f"Pool size must be at least 1, got {size}")
+        if size > 1 and getattr(browser_kwargs.get("profile"), "path", None):
+            raise BrowserException(
+                "A browser profile cannot be shared by a pool of more than one browser"
+            )
+
+        self.size = size
+        self.max_uses = max_uses
+        self.timeout = timeout
+        self.browser_kwargs = browser_kwargs
+        # Free slots; None marks a slot whose browser still has to be created
+        self._available: "queue.Queue[Optional[Browser]]" = queue.Queue(maxsize=size)
+        self._uses: Dict[Browser, int] = {}
+        self._lock = threading.Lock()
+        self._closed = False
+
+        try:
+            for _ in range(size):
+                self._available.put(self._create_browser())
+        except Exception:
+            self.close()
+            raise
+
+        logger.info(f"Browser pool initialized with {size} browsers")
+
+    def _create_browser(self) -> Browser:
+        """Create a new pooled browser instance."""
+        browser = Browser(**self.browser_kwargs)
+        with self._lock:
+            self._uses[browser] = 0
+        return browser
+
+    def _discard_browser(self, browser: Browser) -> None:
+        """Quit a browser and stop tracking it."""
+        with self._lock:
+            self._uses.pop(browser, None)
+        try:
+            browser.quit()
+        except BrowserException as e:
+            logger.warning(f"Failed to quit pooled browser: {str(e)}")
+
+    def _reset_browser(self, browser: Browser) -> bool:
+        """
+        Reset browser state so the next user starts from a clean slate.
+
+        Args:
+            browser (Browser): Browser to reset
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        try:
+            browser.driver.delete_all_cookies()
+            browser.driver.get("about:blank")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to reset pooled browser: {str(e)}")
+            return False
+
+    def acquire(self, timeout: Optional[float] = None) -> Browser:
+        """
+        Check out a browser from the pool.
+
+        Args:
+            timeout (float, optional): Seconds to wait for a free browser,
+                overrides the pool default
+
+        Returns:
+            Browser: Ready-to-use browser instance
+        """
+        if self._closed:
+            raise BrowserException("Cannot acquire from a closed browser pool")
+
+        try:
+            browser = self._available.get(
+                timeout=timeout if timeout is not None else self.timeout
+            )
+        except queue.Empty:
+            raise BrowserException("Timed out waiting for a pooled browser")
+
+        if browser is None:
+            try:
+                browser = self._create_browser()
+            except Exception:
+                # Keep the slot so a later acquire() can retry
+                self._available.put(None)
+                raise
+
+        with self._lock:
+            self._uses[browser] = self._uses.get(browser, 0) + 1
+        return browser
+
+    def release(self, browser: Browser, broken: bool = False) -> None:
+        """
+        Return a browser to the pool.
+
+        Args:
+            browser (Browser): Browser previously returned by acquire()
+            broken (bool): Whether the browser failed and must be recreated
+        """
+        if self._closed:
+            self._discard_browser(browser)
+            return
+
+        with self._lock:
+            uses = self._uses.get(browser, 0)
+
+        if broken or uses >= self.max_uses or not self._reset_browser(browser):
+            logger.debug(f"Recycling pooled browser after {uses} uses")
+            self._discard_browser(browser)
+            try:
+                browser = self._create_browser()
+            except Exception as e:
+                logger.warning(f"Failed to recreate pooled browser: {str(e)}")
+                browser = None
+
+        self._available.put(browser)
+
+    def close(self) -> None:
+        """Quit all idle browsers and shut down the pool."""
+        self._closed = True
+        while True:
+            try:
+                browser = self._available.get_nowait()
+            except queue.Empty:
+                break
+            if browser is not None:
+                self._discard_browser(browser)
+        logger.info("Browser pool closed")
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
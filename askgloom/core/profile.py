@@ -4,20 +4,57 @@ Handles loading, saving, and validating configuration settings.
 """
 
 import os
+import copy
 import json
 import logging
+import functools
+import tempfile
+import threading
 from typing import Dict, Any, Optional
 from pathlib import Path
 from ..exceptions.core_exceptions import ConfigurationException
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, fall back to the stdlib json module
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Marks keys that are absent from the configuration in the lookup cache
+_MISSING = object()
+
+@functools.lru_cache(maxsize=None)
+def _default_config_path() -> str:
+    """Get default configuration file path based on OS, creating its directory once."""
+    if os.name == 'nt':  # Windows
+        config_dir = Path(os.getenv('APPDATA')) / 'AskGloom'
+    else:  # Unix-like
+        config_dir = Path.home() / '.config' / 'askgloom'
+
+    config_dir.mkdir(parents=True, exist_ok=True)
+    return str(config_dir / 'config.json')
+
+@functools.lru_cache(maxsize=None)
+def _default_profiles_path() -> str:
+    """Get default profiles location based on OS."""
+    if os.name == 'nt':  # Windows
+        return str(Path(os.getenv('LOCALAPPDATA')) / 'AskGloom' / 'Profiles')
+    # Unix-like
+    return str(Path.home() / '.config' / 'askgloom' / 'profiles')
+
 class Config:
     """
     Manages configuration settings for Ask Gloom Core.
     Supports both global and local configurations.
+
+    Use Config.get_instance() to share a single, lazily loaded configuration
+    across the process instead of constructing Config directly.
     """
 
+    _instance: Optional["Config"] = None
+    _lock = threading.Lock()
+
     DEFAULT_CONFIG = {
         "browser": {
             "default_profile": "default",
@@ -27,7 +64,8 @@ class Config:
                 "height": 1080
             },
             "user_agent": None,
-            "timeout": 30
+            "timeout": 30,
+            "driver_path": None
         },
         "profiles": {
             "location": None,  # Will be set based on OS
@@ -42,6 +80,10 @@ class Config:
             "wait_time": 5,
             "retry_attempts": 3,
             "screenshot_on_error": True
+        },
+        "pool": {
+            "size": 4,
+            "max_uses": 50
         }
     }
 
@@ -52,49 +94,75 @@ class Config:
         Args:
             config_path (str, optional): Path to configuration file
         """
-        self.config_path = config_path or self._get_default_config_path()
+        self.config_path = config_path or _default_config_path()
+        self._config_file = Path(self.config_path)
         self.config: Dict[str, Any] = {}
+        self._get_cache: Dict[str, Any] = {}
+        # Bumped on every change so a lookup racing a set() does not cache
+        # the value it read before the change
+        self._cache_version = 0
+        self._cache_lock = threading.Lock()
         self.load_config()
 
-    def _get_default_config_path(self) -> str:
-        """Get default configuration file path based on OS."""
-        if os.name == 'nt':  # Windows
-            config_dir = Path(os.getenv('APPDATA')) / 'AskGloom'
-        else:  # Unix-like
-            config_dir = Path.home() / '.config' / 'askgloom'
+    @classmethod
+    def get_instance(cls, config_path: Optional[str] = None) -> "Config":
+        """
+        Get the shared configuration instance, creating it on first use.
+
+        Args:
+            config_path (str, optional): Path to configuration file, only used
+                when the instance is first created
+
+        Returns:
+            Config: Shared configuration instance
+        """
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls(config_path)
+        return cls._instance
+
+    def load_config(self, force: bool = False) -> None:
+        """
+        Load configuration from file or create default.
 
-        config_dir.mkdir(parents=True, exist_ok=True)
-        return str(config_dir / 'config.json')
+        Args:
+            force (bool): Reload from file even if already loaded
+        """
+        if self.config and not force:
+            return
 
-    def load_config(self) -> None:
-        """Load configuration from file or create default."""
         try:
-            config_file = Path(self.config_path)
-            
-            if config_file.exists():
-                with open(config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
-                    # Merge with defaults to ensure all required fields exist
-                    self.config = self._merge_configs(self.DEFAULT_CONFIG, loaded_config)
+            if self._config_file.exists():
+                if orjson is not None:
+                    loaded_config = orjson.loads(self._config_file.read_bytes())
+                else:
+                    with open(self._config_file, 'r', encoding='utf-8') as f:
+                        loaded_config = json.load(f)
+                # Merge with defaults to ensure all required fields exist
+                self.config = self._merge_configs(self.DEFAULT_CONFIG, loaded_config)
+                self._invalidate_cache()
                 logger.debug("Configuration loaded successfully")
             else:
                 logger.info("No configuration file found, creating default")
                 self.config = self.DEFAULT_CONFIG.copy()
                 self._set_os_specific_defaults()
+                self._invalidate_cache()
                 self.save_config()
 
         except Exception as e:
             logger.error(f"Failed to load configuration: {str(e)}")
             raise ConfigurationException(f"Configuration loading failed: {str(e)}")
 
+    def _invalidate_cache(self) -> None:
+        """Drop cached lookups after the configuration changed."""
+        with self._cache_lock:
+            self._cache_version += 1
+            self._get_cache.clear()
+
     def _set_os_specific_defaults(self) -> None:
         """Set OS-specific default values."""
-        if os.name == 'nt':  # Windows
-            profiles_location = str(Path(os.getenv('LOCALAPPDATA')) / 'AskGloom' / 'Profiles')
-        else:  # Unix-like
-            profiles_location = str(Path.home() / '.config' / 'askgloom' / 'profiles')
-
-        self.config['profiles']['location'] = profiles_location
+        self.config['profiles']['location'] = _default_profiles_path()
 
     def _merge_configs(self, default: Dict, custom: Dict) -> Dict:
         """
@@ -107,21 +175,52 @@ class Config:
         Returns:
             Dict: Merged configuration
         """
-        result = default.copy()
+        # Shallow overrides need no nested merge
+        if not any(
+            isinstance(value, dict) and isinstance(default.get(key), dict)
+            for key, value in custom.items()
+        ):
+            return {**default, **custom}
+
+        result = copy.deepcopy(default)
+        stack = [(result, custom)]
         
-        for key, value in custom.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._merge_configs(result[key], value)
-            else:
-                result[key] = value
+        # Walk nested levels with an explicit stack, merging in place
+        while stack:
+            dst, src = stack.pop()
+            for key, value in src.items():
+                if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+                    stack.append((dst[key], value))
+                else:
+                    dst[key] = value
                 
         return result
 
     def save_config(self) -> None:
         """Save current configuration to file."""
         try:
-            with open(self.config_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=4)
+            if orjson is not None:
+                data = orjson.dumps(self.config, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.config, indent=4).encode('utf-8')
+
+            # Write to a uniquely named temporary file and swap it in, so a
+            # crash mid-write never leaves a truncated configuration behind
+            # and concurrent saves never share a temporary file
+            fd, tmp_file = tempfile.mkstemp(
+                dir=self._config_file.parent,
+                prefix=f".{self._config_file.name}.",
+                suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp_file, self._config_file)
+            except BaseException:
+                os.unlink(tmp_file)
+                raise
             logger.debug("Configuration saved successfully")
         except Exception as e:
             logger.error(f"Failed to save configuration: {str(e)}")
@@ -139,12 +238,21 @@ class Config:
             Any: Configuration value
         """
         try:
-            value = self.config
-            for k in key.split('.'):
-                value = value[k]
-            return value
-        except (KeyError, TypeError):
-            return default
+            value = self._get_cache[key]
+        except KeyError:
+            # Resolve the dotted path once, caching misses as well
+            version = self._cache_version
+            try:
+                value = self.config
+                for k in key.split('.'):
+                    value = value[k]
+            except (KeyError, TypeError):
+                value = _MISSING
+            with self._cache_lock:
+                if version == self._cache_version:
+                    self._get_cache[key] = value
+
+        return default if value is _MISSING else value
 
     def set(self, key: str, value: Any, save: bool = True) -> None:
         """
@@ -167,6 +275,7 @@ class Config:
                 
             # Set the value
             current[keys[-1]] = value
+            self._invalidate_cache()
             
             if save:
                 self.save_config()
@@ -181,5 +290,6 @@ class Config:
         """Reset configuration to defaults."""
         self.config = self.DEFAULT_CONFIG.copy()
         self._set_os_specific_defaults()
+        self._invalidate_cache()
         self.save_config()
         logger.info("Configuration reset to defaults")
\ No newline at end of file
@@ -58,7 +58,7 @@ def config_example():
     """Demonstrate configuration management."""
     try:
         # Initialize config
-        config = Config()
+        config = Config.get_instance()
         
         # Update some settings
         config.set("browser.timeout", 60)
@@ -77,6 +77,22 @@ def config_example():
     except Exception as e:
         logger.error(f"Configuration example failed: {e}")
 
+def parallel_navigation_example():
+    """Demonstrate navigating to several URLs concurrently."""
+    try:
+        urls = [
+            "https://example.com",
+            "https://example.org",
+            "https://example.net",
+        ]
+        
+        # Each URL is loaded by one of the pooled browsers
+        for url in Browser.navigate_many(urls, max_workers=3, headless=True):
+            logger.info(f"Visited: {url}")
+            
+    except Exception as e:
+        logger.error(f"Parallel navigation example failed: {e}")
+
 def main():
     """Run all examples."""
     logger.info("Starting Ask Gloom Core examples...")
@@ -90,6 +106,9 @@ def main():
     logger.info("\n3. Configuration Example")
     config_example()
     
+    logger.info("\n4. Parallel Navigation Example")
+    parallel_navigation_example()
+    
     logger.info("\nExamples completed!")
 
 if __name__ == "__main__":
@@ -0,0 +1,54 @@
+"""
+Tests for CachedFormatter timestamps against logging.Formatter.
+"""
+
+import logging
+import time
+
+import pytest
+
+from utils.logger import DEFAULT_DATE_FORMAT, DEFAULT_FORMAT, CachedFormatter
+
+# Zones with no DST, hourly and half-hourly DST shifts, and a fractional offset
+TIMEZONES = [
+    "UTC",
+    "America/New_York",
+    "Europe/London",
+    "Australia/Lord_Howe",
+    "Asia/Kolkata",
+]
+
+# 2026-01-01 00:00:00 UTC
+YEAR_START = 1767225600
+
+
+@pytest.fixture
+def timezone(request, monkeypatch):
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is not available on this platform")
+    monkeypatch.setenv("TZ", request.param)
+    time.tzset()
+    yield request.param
+    monkeypatch.undo()
+    time.tzset()
+
+
+def make_record(created: float) -> logging.LogRecord:
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    record.created = created
+    record.msecs = 0
+    return record
+
+
+@pytest.mark.parametrize("timezone", TIMEZONES, indirect=True)
+def test_default_time_matches_stdlib_across_a_year(timezone):
+    cached = CachedFormatter(DEFAULT_FORMAT, DEFAULT_DATE_FORMAT)
+    expected = logging.Formatter(DEFAULT_FORMAT, DEFAULT_DATE_FORMAT)
+
+    # An odd step walks every hour, including DST transitions, over the year
+    for created in range(YEAR_START, YEAR_START + 366 * 86400, 997):
+        record = make_record(created)
+        assert cached.formatTime(record, DEFAULT_DATE_FORMAT) == expected.formatTime(
+            make_record(created), DEFAULT_DATE_FORMAT
+        )
+
@@ -0,0 +1,148 @@
+"""
+Tests for BrowserPool, using a stub in place of the selenium-backed Browser.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from askgloom.core import pool as pool_module
+from askgloom.core.pool import BrowserPool
+from askgloom.exceptions.core_exceptions import BrowserException
+
+
+class StubDriver:
+    """Records the calls BrowserPool makes to reset a browser."""
+
+    def __init__(self):
+        self.resets = 0
+
+    def delete_all_cookies(self):
+        self.resets += 1
+
+    def get(self, url):
+        pass
+
+
+class StubBrowser:
+    """Stand-in for Browser that counts instances and can be made to fail."""
+
+    created = 0
+    fail = False
+
+    def __init__(self, **kwargs):
+        if StubBrowser.fail:
+            raise BrowserException("stub browser failed to start")
+        StubBrowser.created += 1
+        self.kwargs = kwargs
+        self.driver = StubDriver()
+        self.closed = False
+
+    def quit(self):
+        self.closed = True
+
+
+@pytest.fixture(autouse=True)
+def stub_browser(monkeypatch):
+    StubBrowser.created = 0
+    StubBrowser.fail = False
+    monkeypatch.setattr(pool_module, "Browser", StubBrowser)
+    return StubBrowser
+
+
+def test_acquire_release_reuses_browser():
+    pool = BrowserPool(size=1, max_uses=10, timeout=0.1)
+
+    browser = pool.acquire()
+    pool.release(browser)
+
+    assert pool.acquire() is browser
+    assert browser.driver.resets == 1
+    assert StubBrowser.created == 1
+
+
+def test_acquire_times_out_when_pool_is_exhausted():
+    pool = BrowserPool(size=1, max_uses=10, timeout=0.1)
+    pool.acquire()
+
+    with pytest.raises(BrowserException):
+        pool.acquire()
+
+
+def test_browser_recycled_after_max_uses():
+    pool = BrowserPool(size=1, max_uses=2, timeout=0.1)
+
+    first = pool.acquire()
+    pool.release(first)
+    assert pool.acquire() is first
+    pool.release(first)
+
+    second = pool.acquire()
+    assert second is not first
+    assert first.closed
+    assert StubBrowser.created == 2
+
+
+def test_broken_browser_is_recreated():
+    pool = BrowserPool(size=1, max_uses=10, timeout=0.1)
+
+    browser = pool.acquire()
+    pool.release(browser, broken=True)
+
+    assert browser.closed
+    assert pool.acquire() is not browser
+
+
+def test_failed_recreate_keeps_slot():
+    pool = BrowserPool(size=1, max_uses=10, timeout=0.1)
+    browser = pool.acquire()
+
+    StubBrowser.fail = True
+    pool.release(browser, broken=True)
+    with pytest.raises(BrowserException):
+        pool.acquire()
+
+    StubBrowser.fail = False
+    replacement = pool.acquire()
+    assert replacement is not browser
+    assert not replacement.closed
+
+
+def test_failed_init_quits_created_browsers(monkeypatch):
+    browsers = []
+
+    class FailingThird(StubBrowser):
+        def __init__(self, **kwargs):
+            if len(browsers) == 2:
+                raise BrowserException("stub browser failed to start")
+            super().__init__(**kwargs)
+            browsers.append(self)
+
+    monkeypatch.setattr(pool_module, "Browser", FailingThird)
+
+    with pytest.raises(BrowserException):
+        BrowserPool(size=3, max_uses=10)
+    assert [b.closed for b in browsers] == [True, True]
+
+
+def test_release_after_close_quits_browser():
+    pool = BrowserPool(size=1, max_uses=10, timeout=0.1)
+    browser = pool.acquire()
+
+    pool.close()
+    assert not browser.closed
+    pool.release(browser)
+
+    assert browser.closed
+    with pytest.raises(BrowserException):
+        pool.acquire()
+
+
+def test_shared_profile_rejected():
+    profile = SimpleNamespace(path="/tmp/askgloom-profile")
+
+    with pytest.raises(BrowserException):
+        BrowserPool(size=2, max_uses=10, profile=profile)
+
+    pool = BrowserPool(size=1, max_uses=10, profile=profile)
+    assert pool.acquire().kwargs["profile"] is profile
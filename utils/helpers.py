@@ -5,10 +5,15 @@ Provides utility functions used throughout the framework.
 
 import os
 import re
+import copy
+import functools
 import time
 import random
+import secrets
 import string
 import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Optional, TypeVar, Union
 from pathlib import Path
 from urllib.parse import urlparse
@@ -17,18 +22,31 @@ from ..exceptions import ValidationException, TimeoutException
 
 T = TypeVar('T')
 
+# Characters not allowed in filenames, and a table dropping control characters
+_INVALID_FILENAME_RE = re.compile(r'[<>:"/\\|?*]')
+_CONTROL_CHARS_TABLE = dict.fromkeys(range(32))
+
+# Worker threads for deleting directories in the background
+_CLEANUP_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="askgloom-cleanup")
+
 def retry_on_exception(
-    func: Callable[..., T],
+    func: Optional[Callable[..., T]] = None,
     exceptions: tuple = (Exception,),
     attempts: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
     logger: Optional[Any] = None
-) -> T:
+) -> Any:
     """Retry a function on exception with exponential backoff.
     
+    Called with a zero-argument function, runs it immediately with retries.
+    Called without one, returns a decorator applying the same retry policy:
+    
+        @retry_on_exception(attempts=5, exceptions=(TimeoutException,))
+        def fetch(url): ...
+    
     Args:
-        func: Function to retry
+        func: Function to retry, omit to get a decorator
         exceptions: Tuple of exceptions to catch
         attempts: Maximum number of attempts
         delay: Initial delay between attempts
@@ -36,43 +54,64 @@ def retry_on_exception(
         logger: Logger instance for debugging
     
     Returns:
-        Result of the function call
+        Result of the function call, or a decorator if func is omitted
     
     Raises:
         The last exception if all attempts fail
     """
-    for attempt in range(attempts):
-        try:
-            return func()
-        except exceptions as e:
-            if logger:
-                logger.warning(f"Attempt {attempt + 1}/{attempts} failed: {str(e)}")
-            if attempt == attempts - 1:
-                raise
-            time.sleep(delay * (backoff ** attempt))
+    # Delay before each retry, computed once per policy
+    sleeps = tuple(delay * (backoff ** i) for i in range(attempts - 1))
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            for attempt in range(attempts):
+                try:
+                    return fn(*args, **kwargs)
+                except exceptions as e:
+                    if logger:
+                        logger.warning(f"Attempt {attempt + 1}/{attempts} failed: {str(e)}")
+                    if attempt == attempts - 1:
+                        raise
+                    time.sleep(sleeps[attempt])
+        return wrapper
+
+    if func is None:
+        return decorator
+    return decorator(func)()
 
 def wait_until(
     condition: Callable[[], bool],
     timeout: float = 30.0,
     interval: float = 0.5,
-    message: str = "Condition not met"
+    message: str = "Condition not met",
+    event: Optional[threading.Event] = None
 ) -> None:
     """Wait until a condition is met or timeout occurs.
     
     Args:
         condition: Function that returns True when condition is met
         timeout: Maximum time to wait in seconds
-        interval: Time between checks in seconds
+        interval: Maximum time between checks in seconds
         message: Error message if timeout occurs
+        event: Event set by the caller when the condition may have changed,
+            waking the wait early instead of sleeping the full interval
     
     Raises:
         TimeoutException: If condition is not met within timeout
     """
-    start_time = time.time()
-    while time.time() - start_time < timeout:
+    deadline = time.monotonic() + timeout
+    while True:
         if condition():
             return
-        time.sleep(interval)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if event is not None:
+            event.wait(min(interval, remaining))
+            event.clear()
+        else:
+            time.sleep(min(interval, remaining))
     raise TimeoutException(message, timeout=timeout)
 
 def validate_type(value: Any, expected_type: type, field: str = "") -> None:
@@ -92,6 +131,15 @@ def validate_type(value: Any, expected_type: type, field: str = "") -> None:
             field=field
         )
 
+@functools.lru_cache(maxsize=1024)
+def _parse_url_valid(url: str) -> bool:
+    """Check a URL for a scheme and network location, caching results."""
+    try:
+        result = urlparse(url)
+        return bool(result.scheme and result.netloc)
+    except Exception:
+        return False
+
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL.
     
@@ -101,26 +149,29 @@ def validate_url(url: str) -> bool:
     Returns:
         True if URL is valid, False otherwise
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except Exception:
+    # A network location always follows "//", so skip parsing without one
+    if not isinstance(url, str) or '//' not in url:
         return False
+    return _parse_url_valid(url)
 
 def generate_random_string(
     length: int = 10,
-    chars: str = string.ascii_letters + string.digits
+    chars: str = string.ascii_letters + string.digits,
+    secure: bool = False
 ) -> str:
     """Generate a random string of specified length.
     
     Args:
         length: Length of the string
         chars: Characters to choose from
+        secure: Use a cryptographically secure random source
     
     Returns:
         Random string
     """
-    return ''.join(random.choice(chars) for _ in range(length))
+    if secure:
+        return ''.join(secrets.choice(chars) for _ in range(length))
+    return ''.join(random.choices(chars, k=length))
 
 def create_directory(path: Union[str, Path], exist_ok: bool = True) -> Path:
     """Create a directory and its parents if they don't exist.
@@ -136,14 +187,35 @@ def create_directory(path: Union[str, Path], exist_ok: bool = True) -> Path:
     path.mkdir(parents=True, exist_ok=exist_ok)
     return path
 
-def remove_directory(path: Union[str, Path], ignore_errors: bool = False) -> None:
+def remove_directory(
+    path: Union[str, Path],
+    ignore_errors: bool = False,
+    background: bool = False
+) -> Optional[Future]:
     """Remove a directory and its contents.
     
     Args:
         path: Directory path
         ignore_errors: Don't raise error if directory doesn't exist
+        background: Move the directory aside and delete it on a worker thread,
+            so the path is free again as soon as this returns
+    
+    Returns:
+        Future of the background deletion, or None if removed synchronously
     """
-    shutil.rmtree(path, ignore_errors=ignore_errors)
+    path = Path(path)
+    if not background:
+        shutil.rmtree(path, ignore_errors=ignore_errors)
+        return None
+
+    trash = path.with_name(f"{path.name}.old.{secrets.token_hex(4)}")
+    try:
+        os.replace(path, trash)
+    except OSError:
+        if ignore_errors:
+            return None
+        raise
+    return _CLEANUP_POOL.submit(shutil.rmtree, trash, ignore_errors=ignore_errors)
 
 def is_valid_path(path: Union[str, Path]) -> bool:
     """Check if a path is valid for the current OS.
@@ -170,12 +242,21 @@ def merge_dicts(dict1: Dict, dict2: Dict) -> Dict:
     Returns:
         Merged dictionary
     """
-    result = dict1.copy()
-    for key, value in dict2.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = merge_dicts(result[key], value)
-        else:
-            result[key] = value
+    if not any(
+        isinstance(value, dict) and isinstance(dict1.get(key), dict)
+        for key, value in dict2.items()
+    ):
+        return {**dict1, **dict2}
+
+    result = copy.deepcopy(dict1)
+    stack = [(result, dict2)]
+    while stack:
+        dst, src = stack.pop()
+        for key, value in src.items():
+            if key in dst and isinstance(dst[key], dict) and isinstance(value, dict):
+                stack.append((dst[key], value))
+            else:
+                dst[key] = value
     return result
 
 def parse_selector(selector: str) -> tuple:
@@ -201,11 +282,9 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
-    # Remove control characters
-    filename = "".join(char for char in filename if ord(char) >= 32)
-    return filename.strip()
+    # Remove invalid characters, then control characters
+    filename = _INVALID_FILENAME_RE.sub('', filename)
+    return filename.translate(_CONTROL_CHARS_TABLE).strip()
 
 def format_timespan(seconds: float) -> str:
     """Format a timespan in seconds to a human-readable string.
@@ -216,16 +295,13 @@ def format_timespan(seconds: float) -> str:
     Returns:
         Formatted string (e.g., "2h 30m 45s")
     """
-    hours = int(seconds // 3600)
-    minutes = int((seconds % 3600) // 60)
-    seconds = int(seconds % 60)
-    
-    parts = []
-    if hours > 0:
-        parts.append(f"{hours}h")
-    if minutes > 0:
-        parts.append(f"{minutes}m")
-    if seconds > 0 or not parts:
-        parts.append(f"{seconds}s")
-    
-    return " ".join(parts)
\ No newline at end of file
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    
+    if hours:
+        if minutes:
+            return f"{hours}h {minutes}m {secs}s" if secs else f"{hours}h {minutes}m"
+        return f"{hours}h {secs}s" if secs else f"{hours}h"
+    if minutes:
+        return f"{minutes}m {secs}s" if secs else f"{minutes}m"
+    return f"{secs}s"
\ No newline at end of file
@@ -3,16 +3,279 @@ Logging module for Ask Gloom.
 Provides customizable logging functionality with different output formats and levels.
 """
 
+import atexit
+import functools
 import logging
+import os
+import queue
+import re
 import sys
+import threading
+import time
 from datetime import datetime
+from logging.handlers import (
+    QueueHandler,
+    QueueListener,
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+)
 from pathlib import Path
-from typing import Optional, Union, Dict, Any
+from typing import Optional, Union, Dict, Any, List, Set, Tuple
 
 # Default logging format
 DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+# Plain "%(field)s" placeholders in a format string
+_FIELD_RE = re.compile(r"%\((\w+)\)s")
+
+class CachedFormatter(logging.Formatter):
+    """Formatter that renders a record's message and timestamp only once.
+    
+    When the same formatter is shared by several handlers, each handler
+    formats the same LogRecord. The rendered message and asctime are stored
+    on the record so subsequent handlers reuse them. The formatted timestamp
+    is also cached per second, so bursts of records skip strftime, and simple
+    format strings are split into fields once instead of on every record.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize formatter; accepts the same arguments as logging.Formatter."""
+        super().__init__(*args, **kwargs)
+        
+        # (second, datefmt, formatted) of the most recently formatted time
+        self._time_cache: Tuple[Optional[int], Optional[str], str] = (None, None, "")
+        
+        # (start, end, "YYYY-MM-DD ") of the current local day, used to build
+        # default-format timestamps without strftime; a single tuple so
+        # threads sharing the formatter never see a half-updated day
+        self._day: Tuple[int, int, str] = (0, 0, "")
+        
+        # The default format is common enough to get a dedicated path
+        self._default_fmt = (
+            type(self._style) is logging.PercentStyle
+            and self._fmt == DEFAULT_FORMAT
+        )
+        
+        # Literal separators and field names of a format string made only of
+        # "%(field)s" placeholders; None when the string needs the full parser
+        self._seps: Optional[Tuple[str, ...]] = None
+        self._fields: Tuple[str, ...] = ()
+        if type(self._style) is logging.PercentStyle:
+            parts = _FIELD_RE.split(self._fmt)
+            seps = tuple(parts[0::2])
+            if not any('%' in sep for sep in seps):
+                self._seps = seps
+                self._fields = tuple(parts[1::2])
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the record, reusing a previously rendered message."""
+        # Only trust the cache while msg and args are the ones it was built
+        # from; copies such as QueueHandler.prepare() replace them
+        cached = record.__dict__.get('_cached_message')
+        if cached is not None and cached[0] is record.msg and cached[1] is record.args:
+            message = cached[2]
+        else:
+            message = record.getMessage()
+            record._cached_message = (record.msg, record.args, message)
+        record.message = message
+        if self.usesTime():
+            record.asctime = self.formatTime(record, self.datefmt)
+        s = self.formatMessage(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + record.exc_text
+        if record.stack_info:
+            if s[-1:] != "\n":
+                s = s + "\n"
+            s = s + self.formatStack(record.stack_info)
+        return s
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        """Substitute record fields into the precompiled format string."""
+        if self._default_fmt:
+            return " - ".join(
+                (record.asctime, record.name, record.levelname, record.message)
+            )
+        seps = self._seps
+        if seps is None:
+            return super().formatMessage(record)
+        values = record.__dict__
+        try:
+            parts = [seps[0]]
+            for field, sep in zip(self._fields, seps[1:]):
+                parts.append(str(values[field]))
+                parts.append(sep)
+        except KeyError:
+            return super().formatMessage(record)
+        return "".join(parts)
+
+    def formatTime(
+        self,
+        record: logging.LogRecord,
+        datefmt: Optional[str] = None
+    ) -> str:
+        """Format the record's creation time, reusing a previous rendering."""
+        # Formatters sharing the record may convert or render time differently
+        key = (datefmt, self.converter, self.default_msec_format)
+        cached = record.__dict__.get('_cached_asctime')
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        second = int(record.created)
+        cached_second, cached_datefmt, formatted = self._time_cache
+        if second != cached_second or datefmt != cached_datefmt:
+            if datefmt == DEFAULT_DATE_FORMAT:
+                formatted = self._format_default_time(second)
+            else:
+                formatted = time.strftime(
+                    datefmt or self.default_time_format,
+                    self.converter(record.created)
+                )
+            self._time_cache = (second, datefmt, formatted)
+
+        if datefmt or not self.default_msec_format:
+            asctime = formatted
+        else:
+            asctime = self.default_msec_format % (formatted, record.msecs)
+        record._cached_asctime = (key, asctime)
+        return asctime
+
+    def _format_default_time(self, second: int) -> str:
+        """Format a timestamp in DEFAULT_DATE_FORMAT using integer arithmetic.
+        
+        The date prefix is rendered once per local day; the time of day is
+        derived from the offset into the day. Days with a UTC offset change
+        (DST transitions) fall back to strftime.
+        """
+        day_start, day_end, day_prefix = self._day
+        if not day_start <= second < day_end:
+            local = self.converter(second)
+            day_start = second - (local.tm_hour * 3600 + local.tm_min * 60 + local.tm_sec)
+            last = self.converter(day_start + 86399)
+            last_second = (last.tm_mday, last.tm_hour, last.tm_min, last.tm_sec)
+            if last_second != (local.tm_mday, 23, 59, 59):
+                return time.strftime(DEFAULT_DATE_FORMAT, local)
+            day_prefix = time.strftime("%Y-%m-%d ", local)
+            self._day = (day_start, day_start + 86400, day_prefix)
+        
+        hours, rest = divmod(second - day_start, 3600)
+        minutes, secs = divmod(rest, 60)
+        return f"{day_prefix}{hours:02d}:{minutes:02d}:{secs:02d}"
+
+class BatchedStreamHandler(logging.StreamHandler):
+    """Stream handler that writes each record in a single call.
+    
+    Records are written together with their terminator, and the stream is
+    only flushed for warnings and above unless it is an interactive terminal.
+    """
+
+    def __init__(self, stream: Optional[Any] = None):
+        """Initialize handler.
+        
+        Args:
+            stream: Stream to write to (defaults to sys.stderr)
+        """
+        super().__init__(stream)
+        self._bind_stream()
+
+    def _bind_stream(self) -> None:
+        """Cache the stream's write method and whether it is a terminal."""
+        self._write = self.stream.write
+        isatty = getattr(self.stream, 'isatty', None)
+        self._flush_always = bool(isatty and isatty())
+
+    def setStream(self, stream: Any) -> Optional[Any]:
+        """Replace the stream, returning the previous one if it changed."""
+        result = super().setStream(stream)
+        self._bind_stream()
+        return result
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a formatted record to the stream."""
+        try:
+            self._write(self.format(record) + self.terminator)
+            if self._flush_always or record.levelno >= logging.WARNING:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# Handler writing to each log file and the settings it was created with,
+# keyed by absolute path; every Logger using the file shares the handler
+_FILE_HANDLERS: Dict[str, Tuple[logging.Handler, Tuple[Any, ...]]] = {}
+_FILE_HANDLERS_LOCK = threading.Lock()
+
+# Attribute naming the outputs ("console" or an absolute log file path) a
+# handler attached by Logger writes to
+_TARGETS_ATTR = '_askgloom_targets'
+
+def _attached_targets(logger: logging.Logger) -> Set[str]:
+    """Get the outputs already served by handlers Logger attached."""
+    targets: Set[str] = set()
+    for handler in logger.handlers:
+        targets.update(getattr(handler, _TARGETS_ATTR, ()))
+    return targets
+
+def _shared_file_handler(
+    log_file: Union[str, Path],
+    file_key: str,
+    settings: Tuple[Any, ...],
+    formatter: logging.Formatter
+) -> logging.Handler:
+    """Get the handler writing to a log file, creating it on first use.
+    
+    Sharing one handler per file keeps two rotating handlers from rolling
+    over the same file. A logger asking for other settings than the file was
+    first opened with gets the existing handler and a warning.
+    
+    Args:
+        log_file: Path to log file
+        file_key: Absolute path of the log file
+        settings: (format_string, date_format, rotation, max_bytes,
+            backup_count, async_io) requested for the file
+        formatter: Formatter for a newly created file handler
+    """
+    with _FILE_HANDLERS_LOCK:
+        cached = _FILE_HANDLERS.get(file_key)
+        if cached is not None:
+            handler, existing = cached
+            if existing != settings:
+                logging.getLogger(__name__).warning(
+                    f"Log file {file_key} is already in use with different "
+                    f"settings; keeping the existing ones"
+                )
+            return handler
+        
+        _, _, rotation, max_bytes, backup_count, async_io = settings
+        if rotation:
+            file_handler: logging.Handler = RotatingFileHandler(
+                log_file,
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            )
+        else:
+            file_handler = logging.FileHandler(log_file)
+        file_handler.setFormatter(formatter)
+        
+        if async_io:
+            # Write records on a background thread so callers never block
+            log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            handler: logging.Handler = QueueHandler(log_queue)
+        else:
+            handler = file_handler
+        
+        setattr(handler, _TARGETS_ATTR, {file_key})
+        _FILE_HANDLERS[file_key] = (handler, settings)
+        return handler
+
 class Logger:
     """Custom logger class with enhanced functionality."""
     
@@ -20,12 +283,15 @@ class Logger:
         self,
         name: str,
         level: int = logging.INFO,
-        format_string: str = DEFAULT_FORMAT,
-        date_format: str = DEFAULT_DATE_FORMAT,
+        format_string: Optional[str] = DEFAULT_FORMAT,
+        date_format: Optional[str] = DEFAULT_DATE_FORMAT,
         log_file: Optional[Union[str, Path]] = None,
         rotation: bool = True,
         max_bytes: int = 10_485_760,  # 10MB
-        backup_count: int = 5
+        backup_count: int = 5,
+        lazy: bool = False,
+        extra_handlers: Optional[List[logging.Handler]] = None,
+        async_io: bool = True
     ):
         """Initialize logger with custom configuration.
         
@@ -34,60 +300,112 @@ class Logger:
             level: Logging level
             format_string: Log message format
             date_format: Date format in log messages
-            log_file: Path to log file (optional)
+            log_file: Path to log file (optional); loggers using the same file
+                share one handler configured by the first of them
             rotation: Whether to use rotating file handler
             max_bytes: Maximum bytes per log file
             backup_count: Number of backup files to keep
+            lazy: Accept callables as messages, only called if the level is enabled
+            extra_handlers: Additional handlers to attach, even if the logger
+                already has handlers; those without a formatter use the
+                logger's formatter
+            async_io: When logging to a file, write records on a background
+                thread so callers never block on I/O
         """
+        # Interned so repeated lookups by equal names compare by identity
+        name = sys.intern(name)
+        if isinstance(format_string, str):
+            format_string = sys.intern(format_string)
+        if isinstance(date_format, str):
+            date_format = sys.intern(date_format)
+        
         self.logger = logging.getLogger(name)
-        self.logger.setLevel(level)
+        self.lazy = lazy
         
-        # Create formatter
-        formatter = logging.Formatter(format_string, date_format)
-        
-        # Add console handler
-        console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setFormatter(formatter)
-        self.logger.addHandler(console_handler)
-        
-        # Add file handler if specified
-        if log_file:
-            if rotation:
-                from logging.handlers import RotatingFileHandler
-                file_handler = RotatingFileHandler(
-                    log_file,
-                    maxBytes=max_bytes,
-                    backupCount=backup_count
-                )
-            else:
-                file_handler = logging.FileHandler(log_file)
-            
-            file_handler.setFormatter(formatter)
-            self.logger.addHandler(file_handler)
+        # Bound once to avoid a method lookup on every log call
+        self._log_debug = self.logger.debug
+        self._log_info = self.logger.info
+        self._log_warning = self.logger.warning
+        self._log_error = self.logger.error
+        self._log_critical = self.logger.critical
+        self._log_exception = self.logger.exception
+        self._is_enabled = self.logger.isEnabledFor
+        self.setLevel(level)
+        
+        # Attach only the outputs this logger does not have yet, so
+        # re-instantiating never duplicates console output but a new log
+        # file is still honoured
+        attached = _attached_targets(self.logger)
+        need_console = 'console' not in attached
+        file_key = os.path.abspath(log_file) if log_file else None
+        need_file = file_key is not None and file_key not in attached
+        
+        # Create formatter shared by all new handlers
+        formatter = CachedFormatter(format_string, date_format)
+        
+        if need_console:
+            console_handler = BatchedStreamHandler(sys.stdout)
+            console_handler.setFormatter(formatter)
+            setattr(console_handler, _TARGETS_ATTR, {'console'})
+            self.logger.addHandler(console_handler)
+        
+        if need_file:
+            settings = (
+                format_string, date_format, rotation, max_bytes, backup_count, async_io
+            )
+            self.logger.addHandler(
+                _shared_file_handler(log_file, file_key, settings, formatter)
+            )
+        
+        # Explicitly passed handlers are always attached
+        for handler in extra_handlers or ():
+            if handler.formatter is None:
+                handler.setFormatter(formatter)
+            self.logger.addHandler(handler)
 
-    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def setLevel(self, level: int) -> None:
+        """Set the logging level.
+        
+        Args:
+            level: Logging level
+        """
+        self.logger.setLevel(level)
+
+    def _message(self, msg: Any) -> Any:
+        """Resolve a lazy message callable."""
+        if self.lazy and callable(msg):
+            return msg()
+        return msg
+
+    def debug(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log debug message."""
-        self.logger.debug(msg, *args, **kwargs)
+        if self._is_enabled(logging.DEBUG):
+            self._log_debug(self._message(msg), *args, **kwargs)
 
-    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def info(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log info message."""
-        self.logger.info(msg, *args, **kwargs)
+        if self._is_enabled(logging.INFO):
+            self._log_info(self._message(msg), *args, **kwargs)
 
-    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def warning(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log warning message."""
-        self.logger.warning(msg, *args, **kwargs)
+        if self._is_enabled(logging.WARNING):
+            self._log_warning(self._message(msg), *args, **kwargs)
 
-    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def error(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log error message."""
-        self.logger.error(msg, *args, **kwargs)
+        if self._is_enabled(logging.ERROR):
+            self._log_error(self._message(msg), *args, **kwargs)
 
-    def critical(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def critical(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log critical message."""
-        self.logger.critical(msg, *args, **kwargs)
+        if self._is_enabled(logging.CRITICAL):
+            self._log_critical(self._message(msg), *args, **kwargs)
 
-    def exception(self, msg: str, *args: Any, **kwargs: Any) -> None:
+    def exception(self, msg: Any, *args: Any, **kwargs: Any) -> None:
         """Log exception message with traceback."""
-        self.logger.exception(msg, *args, **kwargs)
+        if self._is_enabled(logging.ERROR):
+            self._log_exception(self._message(msg), *args, **kwargs)
 
 def setup_logging(
     config: Dict[str, Any],
@@ -119,8 +437,15 @@ def get_logger(
         log_file: Path to log file (optional)
     
     Returns:
-        Configured Logger instance
+        Configured Logger instance, shared between calls with the same arguments
     """
+    return _build_logger(
+        sys.intern(name), level, sys.intern(str(log_file)) if log_file else None
+    )
+
+@functools.lru_cache(maxsize=256)
+def _build_logger(name: str, level: int, log_file: Optional[str]) -> Logger:
+    """Create the Logger for get_logger, memoized on its arguments."""
     return Logger(name, level, log_file=log_file)
 
 class LogContext:
@@ -131,31 +456,40 @@ class LogContext:
         
         Args:
             logger: Logger instance to modify
-            **kwargs: Temporary logger settings
+            **kwargs: Temporary logger settings; names that are not existing
+                logger attributes are ignored
         """
         self.logger = logger
         self.kwargs = kwargs
-        self.old_settings = {}
+        self.old_settings: Dict[str, Any] = {}
+        self._applicable = {
+            key: value for key, value in kwargs.items() if key in logger.__dict__
+        }
 
     def __enter__(self) -> Logger:
         """Save current settings and apply temporary ones."""
-        for key, value in self.kwargs.items():
-            if hasattr(self.logger, key):
-                self.old_settings[key] = getattr(self.logger, key)
-                setattr(self.logger, key, value)
+        attrs = self.logger.__dict__
+        self.old_settings = {key: attrs[key] for key in self._applicable}
+        attrs.update(self._applicable)
         return self.logger
 
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Restore original settings."""
-        for key, value in self.old_settings.items():
-            setattr(self.logger, key, value)
+        self.logger.__dict__.update(self.old_settings)
+
+# Loggers built by create_timed_rotating_logger with their file handler and
+# the day that handler was opened for, keyed by name, directory and mode
+_TIMED_CACHE: Dict[Tuple[str, str, bool], Tuple[Logger, logging.Handler, str]] = {}
+_TIMED_CACHE_LOCK = threading.Lock()
 
 def create_timed_rotating_logger(
     name: str,
     log_dir: Union[str, Path],
     when: str = 'midnight',
     interval: int = 1,
-    backup_count: int = 7
+    backup_count: int = 7,
+    size_based: bool = False,
+    max_bytes: int = 10_485_760  # 10MB
 ) -> Logger:
     """Create a logger that rotates files based on time.
     
@@ -165,24 +499,51 @@ def create_timed_rotating_logger(
         when: When to rotate ('S', 'M', 'H', 'D', 'midnight')
         interval: Interval between rotations
         backup_count: Number of backup files to keep
+        size_based: Rotate a dated file by size instead of by time
+        max_bytes: Maximum bytes per log file when size_based is set
     
     Returns:
-        Configured Logger instance
+        Configured Logger instance, shared between calls for the same name,
+        directory and rotation mode
     """
-    from logging.handlers import TimedRotatingFileHandler
+    name = sys.intern(name)
+    today = datetime.now().strftime('%Y%m%d')
+    key = (name, os.path.abspath(log_dir), size_based)
     
-    log_dir = Path(log_dir)
-    log_dir.mkdir(parents=True, exist_ok=True)
-    
-    log_file = log_dir / f"{name}_{datetime.now():%Y%m%d}.log"
-    
-    logger = Logger(name)
-    handler = TimedRotatingFileHandler(
-        log_file,
-        when=when,
-        interval=interval,
-        backupCount=backup_count
-    )
-    
-    logger.logger.addHandler(handler)
-    return logger
\ No newline at end of file
+    with _TIMED_CACHE_LOCK:
+        cached = _TIMED_CACHE.get(key)
+        # Time-based handlers rotate themselves; dated size-based files are
+        # only replaced once the day changes
+        if cached is not None and (not size_based or cached[2] == today):
+            return cached[0]
+        
+        log_dir = Path(log_dir)
+        log_dir.mkdir(parents=True, exist_ok=True)
+        
+        if size_based:
+            handler: logging.Handler = RotatingFileHandler(
+                log_dir / f"{name}_{today}.log",
+                maxBytes=max_bytes,
+                backupCount=backup_count
+            )
+        else:
+            # The handler appends the date to rotated files itself
+            handler = TimedRotatingFileHandler(
+                log_dir / f"{name}.log",
+                when=when,
+                interval=interval,
+                backupCount=backup_count
+            )
+        
+        if cached is not None:
+            # Swap the previous day's file for today's
+            logger, old_handler, _ = cached
+            handler.setFormatter(old_handler.formatter)
+            logger.logger.addHandler(handler)
+            logger.logger.removeHandler(old_handler)
+            old_handler.close()
+        else:
+            logger = Logger(name, extra_handlers=[handler])
+        
+        _TIMED_CACHE[key] = (logger, handler, today)
+        return logger